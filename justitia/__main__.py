@@ -0,0 +1,8 @@
+"""
+Allow running the CLI as `python -m justitia`.
+"""
+
+from justitia.cli import app
+
+if __name__ == "__main__":
+    app()
@@ -4,15 +4,27 @@ JUSTITIA CLI - Command Line Interface
 Main entry point for the JUSTITIA policy compiler.
 """
 
+import asyncio
+import hashlib
 import json
+import threading
+import time
 import typer
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from rich.console import Console
 from rich.panel import Panel
-from rich import pretty
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
-from justitia.policy import PolicyGenerator, save_policy_pack
-from justitia.tests import PolicyTestSuite, create_sample_test_cases
+
+try:
+    import orjson  # optional: much faster indented JSON serialization
+except ImportError:
+    orjson = None
+
+# justitia.policy (which pulls in ollama + openai_harmony) and
+# justitia.tests (pydantic) are imported lazily inside the commands that
+# need them, so `justitia --help` / `version` don't pay their import cost.
 
 app = typer.Typer(
     name="justitia",
@@ -20,7 +32,67 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+# highlight=False skips the ReprHighlighter regex pass that otherwise
+# runs on every printed string; the JSON preview opts back in locally.
+console = Console(highlight=False)
+
+# On-disk cache of previous generations, keyed by prompt hash
+_CACHE_DIR = Path.home() / ".cache" / "justitia"
+
+
+class Effort(str, Enum):
+    """Valid reasoning-effort levels, enforced at argument-parse time."""
+    low = "low"
+    medium = "medium"
+    high = "high"
+
+
+def _banner(text: str, style: str = "") -> None:
+    """
+    Print a command banner.
+
+    On a terminal this renders the usual Panel; when stdout is piped
+    (CI logs, redirects) it falls back to plain text and skips Rich's
+    panel measurement/segment machinery entirely.
+    """
+    if console.is_terminal:
+        console.print(Panel.fit(text, style=style))
+    else:
+        console.print(text)
+
+
+def _warm_model(model_name: str) -> None:
+    """
+    Opportunistically load the model into Ollama.
+
+    Run in a background thread so the model-load cost overlaps with
+    prompt preparation instead of landing on the user-visible request.
+    """
+    try:
+        import ollama
+        # An empty prompt is Ollama's documented load-only request; a
+        # non-empty one would start a real generation that the user's
+        # request then queues behind
+        ollama.generate(model=model_name, prompt="", keep_alive="10m")
+    except Exception:
+        pass  # warmup is best-effort; the real call reports errors
+
+
+def _generate_streaming(pg: "PolicyGenerator", norms_text: str) -> dict:
+    """Run a streamed generation with a live token-throughput spinner."""
+    with console.status("🔄 Waiting for first token...") as status:
+        start = time.monotonic()
+        chunks = 0
+
+        def _on_chunk(piece: str) -> None:
+            nonlocal chunks
+            chunks += 1
+            elapsed = time.monotonic() - start
+            rate = chunks / elapsed if elapsed > 0 else 0.0
+            status.update(f"🔄 Streaming response... {chunks} tokens ({rate:.1f} tok/s)")
+
+        return pg.generate_policy(norms_text, on_chunk=_on_chunk)
+
 
 @app.command()
 def init(
@@ -28,19 +100,22 @@ def init(
     output_dir: Optional[Path] = typer.Option(None, "--output", "-o", help="Output directory")
 ):
     """Initialize a new policy project"""
-    console.print(Panel.fit(
-        f"🎯 Initializing JUSTITIA policy project: {domain}",
-        style="bold green"
-    ))
+    _banner(f"🎯 Initializing JUSTITIA policy project: {domain}", style="bold green")
     
     # Create project directory
     project_dir = output_dir or Path(f"./justitia-{domain}")
     project_dir.mkdir(exist_ok=True)
     
-    # Create basic structure
-    (project_dir / "norms.txt").touch()
-    (project_dir / "cases.json").touch()
-    (project_dir / "config.json").write_text('{"domain": "' + domain + '", "version": "0.1.0"}')
+    # Create basic structure; overlap the writes so slow (networked)
+    # filesystems pay one round-trip instead of one per file
+    scaffold = [
+        (project_dir / "norms.txt", b""),
+        (project_dir / "cases.json", b""),
+        (project_dir / "config.json",
+         json.dumps({"domain": domain, "version": "0.1.0"}).encode("utf-8")),
+    ]
+    with ThreadPoolExecutor(max_workers=len(scaffold)) as pool:
+        list(pool.map(lambda pc: pc[0].write_bytes(pc[1]), scaffold))
     
     console.print(f"✅ Created project in: {project_dir.absolute()}")
     console.print("📝 Next steps:")
@@ -51,22 +126,24 @@ def init(
 @app.command()
 def generate(
     input_file: Path = typer.Option(..., "--input", "-i", help="Input norms file"),
-    effort: str = typer.Option("medium", "--effort", "-e", help="Reasoning effort: low/medium/high"),
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output directory")
+    effort: Effort = typer.Option(Effort.medium, "--effort", "-e", help="Reasoning effort"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output directory"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk generation cache")
 ):
     """Generate policy from norms"""
-    console.print(Panel.fit(
-        f"🧠 Generating policy with reasoning effort: {effort}",
-        style="bold blue"
-    ))
+    from justitia.policy import PolicyGenerator, save_policy_pack
+
+    _banner(f"🧠 Generating policy with reasoning effort: {effort.value}", style="bold blue")
+
+    # Start loading the model while we read and prepare the prompt
+    threading.Thread(target=_warm_model, args=("gpt-oss:20b",), daemon=True).start()
     
     if not input_file.exists():
         console.print(f"❌ Input file not found: {input_file}", style="red")
         raise typer.Exit(1)
 
-    # Read norms content
-    with input_file.open("r", encoding="utf-8") as f:
-        norms_text = f.read()
+    # Read norms content in one shot (no buffered reader for a whole-file read)
+    norms_text = input_file.read_bytes().decode("utf-8")
 
     # Determine domain and output path
     domain = input_file.parent.name if input_file.parent.name != "." else "default-domain"
@@ -82,39 +159,70 @@ def generate(
     console.print(f"💾 Output directory: {output_path}")
 
     # Initialize policy generator
-    pg = PolicyGenerator(domain=domain, reasoning_effort=effort)
-    
-    console.print("⏳ Contacting gpt-oss model via Ollama...")
-    console.print("🤖 This may take 30-60 seconds for complex policies...")
-    
+    pg = PolicyGenerator(domain=domain, reasoning_effort=effort.value)
+
+    # Identical (norms, domain, effort, model) inputs produce the same
+    # prompt, so re-runs can skip the 30-60s model call entirely.
+    cache_key = hashlib.sha256(json.dumps(
+        {"n": norms_text, "d": domain, "e": effort.value, "m": pg.model_name},
+        sort_keys=True,
+    ).encode("utf-8")).hexdigest()
+    cache_file = _CACHE_DIR / f"{cache_key}.json"
+
+    result = None
+    if not no_cache and cache_file.exists():
+        try:
+            result = json.loads(cache_file.read_text(encoding="utf-8"))
+            console.print(f"⚡ Reusing cached generation: {cache_file.name}")
+        except (json.JSONDecodeError, OSError):
+            result = None
+
     try:
-        result = pg.generate_policy(norms_text)
-        
+        if result is None:
+            result = _generate_streaming(pg, norms_text)
+            if not no_cache:
+                try:
+                    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_text(
+                        json.dumps(result, ensure_ascii=False), encoding="utf-8"
+                    )
+                except OSError:
+                    pass  # cache is best-effort
+
         policy_json = result["policy_json"]
         audit_notebook = result["audit_notebook"]
         raw_response = result["raw_response"]
 
-        console.print("[green]✅ Policy generated successfully!")
-        console.print(f"📄 Saving policy pack to: {output_path}")
-        
+        console.print(
+            "[green]✅ Policy generated successfully![/green]\n"
+            f"📄 Saving policy pack to: {output_path}"
+        )
+
         save_policy_pack(policy_json, audit_notebook, output_path)
-        
+
         # Show previews
         console.print("\n[bold cyan]� Policy JSON Preview:[/bold cyan]")
         if policy_json:
-            pretty.pprint(policy_json, console=console, max_length=3, max_string=100)
+            from rich import pretty
+            # Local console with highlighting for just this preview
+            pretty.pprint(policy_json, console=Console(), max_length=3, max_string=100)
         else:
             console.print("⚠️ JSON parsing failed; see audit notebook for details", style="yellow")
 
-        console.print("\n[bold cyan]📝 Audit Notebook Preview:[/bold cyan]")
-        audit_preview = audit_notebook[:300] + "..." if len(audit_notebook) > 300 else audit_notebook
-        console.print(audit_preview if audit_preview.strip() else "No reasoning captured")
+        audit_preview = f"{audit_notebook[:300]}…" if len(audit_notebook) > 300 else audit_notebook
+
+        # One joined print instead of a write per line (fewer renders/syscalls)
+        console.print("\n".join([
+            "",
+            "[bold cyan]📝 Audit Notebook Preview:[/bold cyan]",
+            audit_preview if audit_preview.strip() else "No reasoning captured",
+            "",
+            "[bold green]🎉 Policy generation complete![/bold green]",
+            "📁 Files saved:",
+            f"   • {output_path}/policy.json",
+            f"   • {output_path}/audit_notebook.md",
+        ]))
 
-        console.print(f"\n[bold green]🎉 Policy generation complete!")
-        console.print(f"📁 Files saved:")
-        console.print(f"   • {output_path}/policy.json")
-        console.print(f"   • {output_path}/audit_notebook.md")
-        
     except RuntimeError as e:
         console.print(f"❌ Error generating policy: {e}", style="red")
         raise typer.Exit(1)
@@ -122,6 +230,78 @@ def generate(
         console.print(f"❌ Unexpected error: {e}", style="red")
         raise typer.Exit(1)
 
+@app.command()
+def generate_batch(
+    input_files: List[Path] = typer.Argument(..., help="Input norms files"),
+    effort: Effort = typer.Option(Effort.medium, "--effort", "-e", help="Reasoning effort"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Base output directory")
+):
+    """Generate policies for several norms files concurrently"""
+    from justitia.policy import PolicyGenerator, save_policy_pack
+
+    _banner(
+        f"🧠 Generating {len(input_files)} policies in parallel (effort: {effort.value})\n"
+        "💡 Server-side concurrency is bounded by OLLAMA_NUM_PARALLEL / OLLAMA_MAX_LOADED_MODELS",
+        style="bold blue"
+    )
+
+    missing = [f for f in input_files if not f.exists()]
+    if missing:
+        for f in missing:
+            console.print(f"❌ Input file not found: {f}", style="red")
+        raise typer.Exit(1)
+
+    # Inputs sharing a parent would all default to parent/generated;
+    # add the stem for those so packs don't overwrite each other
+    parents = [f.parent for f in input_files]
+
+    jobs = []
+    seen_outputs = {}
+    for input_file in input_files:
+        norms_text = input_file.read_bytes().decode("utf-8")
+        domain = input_file.parent.name if input_file.parent.name != "." else "default-domain"
+        # Keyed by domain and stem: the canonical layout names every
+        # input norms.txt, so the stem alone would map all inputs to
+        # the same directory and the packs would overwrite each other
+        if output:
+            output_path = output / domain / input_file.stem
+        elif parents.count(input_file.parent) > 1:
+            output_path = input_file.parent / "generated" / input_file.stem
+        else:
+            output_path = input_file.parent / "generated"
+        resolved = output_path.resolve()
+        if resolved in seen_outputs:
+            console.print(
+                f"❌ Output collision: {seen_outputs[resolved]} and {input_file} "
+                f"both map to {output_path}",
+                style="red",
+            )
+            raise typer.Exit(1)
+        seen_outputs[resolved] = input_file
+        pg = PolicyGenerator(domain=domain, reasoning_effort=effort.value)
+        jobs.append((input_file, output_path, pg, norms_text))
+
+    async def _run_all():
+        tasks = [pg.generate_policy_async(norms_text) for _, _, pg, norms_text in jobs]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    console.print("⏳ Contacting gpt-oss model via Ollama...")
+    results = asyncio.run(_run_all())
+
+    failed = 0
+    for (input_file, output_path, _, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            console.print(f"❌ {input_file}: {result}", style="red")
+            failed += 1
+            continue
+        save_policy_pack(result["policy_json"], result["audit_notebook"], output_path)
+        console.print(f"✅ {input_file} → {output_path}/policy.json")
+
+    if failed:
+        console.print(f"⚠️ {failed} of {len(jobs)} generations failed", style="red")
+        raise typer.Exit(1)
+    console.print("[bold green]🎉 Batch generation complete!")
+
 @app.command()
 def test(
     policy_file: Path = typer.Option(..., "--policy", "-p", help="Policy JSON file"),
@@ -129,10 +309,9 @@ def test(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output report file")
 ):
     """Test policy against test cases"""
-    console.print(Panel.fit(
-        "🧪 Running policy validation tests",
-        style="bold yellow"
-    ))
+    from justitia.tests import PolicyTestSuite
+
+    _banner("🧪 Running policy validation tests", style="bold yellow")
     
     if not policy_file.exists():
         console.print(f"❌ Policy file not found: {policy_file}", style="red")
@@ -156,8 +335,12 @@ def test(
         # Save report if requested
         if output:
             report = test_suite.generate_report(results)
-            with output.open('w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2)
+            if orjson is not None:
+                output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                # stdlib json with indent is a pure-Python encoder path
+                with output.open('w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2)
             console.print(f"📄 Report saved to: {output}")
         
         # Exit with error code if tests failed
@@ -178,19 +361,14 @@ def create_samples(
     output_dir: Path = typer.Option("./examples", "--output", "-o", help="Output directory")
 ):
     """Create sample norms and test cases for a domain"""
-    console.print(Panel.fit(
-        f"� Creating sample files for domain: {domain}",
-        style="bold cyan"
-    ))
+    from justitia.tests import create_sample_test_cases
+
+    _banner(f"� Creating sample files for domain: {domain}", style="bold cyan")
     
     domain_dir = output_dir / domain
     domain_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create sample test cases
     cases_file = domain_dir / "test_cases.json"
-    create_sample_test_cases(domain, cases_file)
-    
-    # Create sample norms based on domain
     norms_file = domain_dir / "norms.txt"
     if domain == "content-moderation":
         norms_content = """Content Moderation Policy
@@ -217,9 +395,16 @@ Generate JSON rules to automatically detect these security issues.
 """
     else:
         norms_content = f"Sample policy norms for {domain} domain.\n\nAdd your specific requirements here."
-    
-    norms_file.write_text(norms_content, encoding='utf-8')
-    
+
+    # Write both sample files concurrently (see init for rationale)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(create_sample_test_cases, domain, cases_file),
+            pool.submit(norms_file.write_text, norms_content, encoding='utf-8'),
+        ]
+        for future in futures:
+            future.result()
+
     console.print(f"✅ Created sample files:")
     console.print(f"  📄 Norms: {norms_file}")
     console.print(f"  🧪 Test cases: {cases_file}")
@@ -232,10 +417,10 @@ Generate JSON rules to automatically detect these security issues.
 def version():
     """Show version info"""
     from justitia import __version__, __description__
-    console.print(Panel.fit(
+    _banner(
         f"JUSTITIA v{__version__}\n{__description__}\n\n🏆 OpenAI Open Model Hackathon 2025",
         style="bold cyan"
-    ))
+    )
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
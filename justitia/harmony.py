@@ -1,3 +1,5 @@
+import functools
+
 from openai_harmony import (
     SystemContent,
     Message,
@@ -11,6 +13,18 @@ from typing import List
 from datetime import datetime
 
 
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Load the Harmony encoding once per process.
+
+    Building the encoding parses the full tokenizer tables, so callers
+    should always go through this cached helper instead of calling
+    load_harmony_encoding directly.
+    """
+    return load_harmony_encoding(HarmonyEncodingName.HARMONY_GPT_OSS)
+
+
 def decode_tokens(token_ids: List[int]) -> str:
     """
     Decode token IDs back to text using Harmony encoding.
@@ -21,8 +35,43 @@ def decode_tokens(token_ids: List[int]) -> str:
     Returns:
         Decoded text string
     """
-    encoding = load_harmony_encoding(HarmonyEncodingName.HARMONY_GPT_OSS)
-    return encoding.decode(token_ids)
+    return _get_encoding().decode(token_ids)
+
+
+# Harmony wants capitalized reasoning-effort labels
+_EFFORT_LABELS = {
+    "low": "Low",
+    "medium": "Medium",
+    "high": "High",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_system_message(
+    reasoning_effort: str,
+    use_browser: bool,
+    use_python: bool,
+    start_date: str,
+) -> Message:
+    """
+    Build a SYSTEM message once per (effort, tools, date) combination.
+
+    The builder chain allocates a fresh SystemContent per call, so batch
+    and test workloads that encode many prompts reuse the cached result.
+    """
+    capitalized_effort = _EFFORT_LABELS.get(reasoning_effort, "Medium")
+
+    system_content = SystemContent.new()\
+        .with_conversation_start_date(start_date)\
+        .with_reasoning_effort(capitalized_effort)\
+        .with_model_identity("gpt-oss")
+
+    if use_browser:
+        system_content = system_content.with_browser_tool()
+    if use_python:
+        system_content = system_content.with_python_tool()
+
+    return Message.from_role_and_content(Role.SYSTEM, system_content)
 
 
 def create_system_message(
@@ -45,25 +94,14 @@ def create_system_message(
     Returns:
         A Harmony SYSTEM Message
     """
-    # Capitalize reasoning effort for Harmony format
-    effort_map = {
-        "low": "Low",
-        "medium": "Medium", 
-        "high": "High"
-    }
-    capitalized_effort = effort_map.get(reasoning_effort.lower(), "Medium")
-    
-    system_content = SystemContent.new()\
-        .with_conversation_start_date(datetime.now().strftime("%Y-%m-%d"))\
-        .with_reasoning_effort(capitalized_effort)\
-        .with_model_identity("gpt-oss")
-
-    if use_browser:
-        system_content = system_content.with_browser_tool()
-    if use_python:
-        system_content = system_content.with_python_tool()
-
-    return Message.from_role_and_content(Role.SYSTEM, system_content)
+    # Lowercasing here keeps direct callers (notebooks) case-insensitive
+    # and dedupes case variants in the cache
+    return _cached_system_message(
+        reasoning_effort.lower(),
+        use_browser,
+        use_python,
+        datetime.now().strftime("%Y-%m-%d"),
+    )
 
 
 def create_user_message(content: str) -> Message:
@@ -103,29 +141,12 @@ def encode_conversation(conversation: Conversation) -> List[int]:
     Returns:
         List of token IDs (integers)
     """
-    encoding = load_harmony_encoding(HarmonyEncodingName.HARMONY_GPT_OSS)
-    return encoding.render_conversation_for_completion(conversation, Role.ASSISTANT)
-
-
-def create_policy_generation_prompt(
-    domain: str,
-    norms_content: str,
-    reasoning_effort: str = "medium",
-    use_python: bool = True
-) -> List[int]:
-    """
-    Create a complete policy generation prompt and encode it for gpt-oss.
+    return _get_encoding().render_conversation_for_completion(conversation, Role.ASSISTANT)
 
-    Args:
-        domain: Policy domain (e.g., 'content-moderation', 'code-review')
-        norms_content: The organizational norms/rules text
-        reasoning_effort: Reasoning effort level ('low', 'medium', 'high')
-        use_python: Whether to enable Python tool for policy testing
 
-    Returns:
-        Token IDs ready for gpt-oss model inference
-    """
-    prompt_template = f"""You are JUSTITIA, an AI policy compiler for the "{domain}" domain.
+# Static portion of the policy-generation prompt; only the domain and
+# norms content vary per call.
+PROMPT_TEMPLATE = """You are JUSTITIA, an AI policy compiler for the "{domain}" domain.
 
 Your task is to transform organizational norms into executable, auditable policies with transparent reasoning.
 
@@ -155,8 +176,29 @@ Your task is to transform organizational norms into executable, auditable polici
 
 Generate the policy now:"""
 
+
+def create_policy_generation_prompt(
+    domain: str,
+    norms_content: str,
+    reasoning_effort: str = "medium",
+    use_python: bool = True
+) -> List[int]:
+    """
+    Create a complete policy generation prompt and encode it for gpt-oss.
+
+    Args:
+        domain: Policy domain (e.g., 'content-moderation', 'code-review')
+        norms_content: The organizational norms/rules text
+        reasoning_effort: Reasoning effort level ('low', 'medium', 'high')
+        use_python: Whether to enable Python tool for policy testing
+
+    Returns:
+        Token IDs ready for gpt-oss model inference
+    """
+    user_prompt = PROMPT_TEMPLATE.format(domain=domain, norms_content=norms_content)
+
     system_msg = create_system_message(domain, reasoning_effort, use_python=use_python)
-    user_msg = create_user_message(prompt_template)
+    user_msg = create_user_message(user_prompt)
     conversation = create_conversation(system_msg, user_msg)
-    
-    return encode_conversation(conversation)
\ No newline at end of file
+
+    return encode_conversation(conversation)
@@ -1,7 +1,13 @@
+import asyncio
+import copy
+import functools
 import json
+import math
+import os
 import re
+import sqlite3
 from pathlib import Path
-from typing import Optional, Dict, Tuple
+from typing import Callable, List, Optional, Dict, Tuple
 import ollama
 from justitia.harmony import (
     create_system_message,
@@ -10,6 +16,303 @@ from justitia.harmony import (
     encode_conversation,
     create_policy_generation_prompt,
 )
+from justitia.policy_cache import CacheBackend, make_cache_key
+
+try:
+    import ijson  # optional: incremental parsing of streamed policy JSON
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _loads = orjson.loads  # C parser; also accepts str input
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# Compiled once; _extract_policy_and_cot runs them per generation
+_THINK_RE = re.compile(r"\*\*THINKING:\*\*(.*?)\*\*POLICY:\*\*", re.DOTALL | re.IGNORECASE)
+_JSON_FENCE_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_FALLBACK_RE = re.compile(r"(\{.*\})", re.DOTALL)
+
+
+def _validate_rule_patterns(policy_data: Dict) -> Dict:
+    """
+    Drop rules whose regex pattern does not compile.
+
+    The model occasionally emits invalid regexes; catching them once
+    here means downstream consumers (PolicyTestSuite, integrations)
+    never hit re.error at match time. Dropped rules are preserved in
+    metadata.invalid_rules for the audit trail.
+    """
+    if not isinstance(policy_data, dict):
+        return policy_data
+    rules = policy_data.get("rules")
+    if not isinstance(rules, list):
+        return policy_data
+
+    valid = []
+    invalid = []
+    for rule in rules:
+        try:
+            re.compile(rule.get("pattern", "") if isinstance(rule, dict) else "")
+            valid.append(rule)
+        except re.error as e:
+            invalid.append({"rule": rule, "error": str(e)})
+
+    if invalid:
+        policy_data["rules"] = valid
+        policy_data.setdefault("metadata", {}).setdefault("invalid_rules", []).extend(invalid)
+    return policy_data
+
+
+class _RuleStreamParser:
+    """
+    Incrementally extract policy rules from a streamed model response.
+
+    Watches for the ```json fence in the output and pushes the fenced
+    bytes into an ijson coroutine, so each rule object is surfaced via
+    the callback as soon as it closes instead of after the full
+    response. Requires ijson; callers fall back to post-hoc parsing
+    when it is unavailable or the stream is malformed.
+    """
+
+    _FENCE_OPEN = "```json"
+    _FENCE_CLOSE = "```"
+
+    def __init__(self, on_rule: Callable[[Dict], None]):
+        sink = self._sink(on_rule)
+        next(sink)  # prime the generator
+        self._coro = ijson.items_coro(sink, "rules.item")
+        self._tail = ""
+        self._in_json = False
+        self._closed = False
+
+    @staticmethod
+    def _sink(on_rule):
+        while True:
+            rule = (yield)
+            on_rule(rule)
+
+    def feed(self, piece: str) -> None:
+        """Consume the next streamed text chunk."""
+        if self._closed:
+            return
+        self._tail += piece
+
+        if not self._in_json:
+            idx = self._tail.find(self._FENCE_OPEN)
+            if idx == -1:
+                # Keep just enough tail to catch a fence split across chunks
+                self._tail = self._tail[-len(self._FENCE_OPEN):]
+                return
+            self._tail = self._tail[idx + len(self._FENCE_OPEN):]
+            self._in_json = True
+
+        end = self._tail.find(self._FENCE_CLOSE)
+        if end != -1:
+            data, self._tail = self._tail[:end], ""
+            self._closed = True
+        else:
+            # Hold back a few chars in case the closing fence is split
+            data, self._tail = self._tail[:-len(self._FENCE_CLOSE)], self._tail[-len(self._FENCE_CLOSE):]
+
+        if data:
+            try:
+                self._coro.send(data.encode("utf-8"))
+            except Exception:
+                # Malformed JSON; the final regex extraction still runs
+                self._closed = True
+
+        if self._closed:
+            try:
+                self._coro.close()
+            except Exception:
+                pass
+
+
+class _SectionStreamParser:
+    """
+    Incremental state machine over the streamed THINKING/POLICY layout.
+
+    Tracks the markers the generation prompt asks the model to emit and
+    collects the audit text and fenced policy JSON while chunks are
+    still arriving, so a well-formed response needs no regex sweep over
+    the full output once the stream ends. A response that never follows
+    the layout simply stays incomplete and the caller falls back to
+    _extract_policy_and_cot.
+    """
+
+    _THINKING = "**thinking:**"
+    _POLICY = "**policy:**"
+    _FENCE_OPEN = "```json"
+    _FENCE_CLOSE = "```"
+
+    def __init__(self):
+        self._state = "preamble"
+        self._buffer = ""
+        self._audit_parts: List[str] = []
+        self._json_parts: List[str] = []
+        self.complete = False
+
+    def feed(self, piece: str) -> None:
+        """Consume the next streamed text chunk."""
+        if self.complete:
+            return
+        self._buffer += piece
+        while True:
+            lowered = self._buffer.lower()
+            if self._state == "preamble":
+                idx = lowered.find(self._THINKING)
+                if idx == -1:
+                    # Keep just enough to catch a marker split across chunks
+                    self._buffer = self._buffer[-(len(self._THINKING) - 1):]
+                    return
+                self._buffer = self._buffer[idx + len(self._THINKING):]
+                self._state = "thinking"
+            elif self._state == "thinking":
+                idx = lowered.find(self._POLICY)
+                if idx == -1:
+                    keep = len(self._POLICY) - 1
+                    if len(self._buffer) > keep:
+                        self._audit_parts.append(self._buffer[:-keep])
+                        self._buffer = self._buffer[-keep:]
+                    return
+                self._audit_parts.append(self._buffer[:idx])
+                self._buffer = self._buffer[idx + len(self._POLICY):]
+                self._state = "policy"
+            elif self._state == "policy":
+                idx = lowered.find(self._FENCE_OPEN)
+                if idx == -1:
+                    self._buffer = self._buffer[-(len(self._FENCE_OPEN) - 1):]
+                    return
+                self._buffer = self._buffer[idx + len(self._FENCE_OPEN):]
+                self._state = "json"
+            else:  # in the fenced JSON block
+                idx = self._buffer.find(self._FENCE_CLOSE)
+                if idx == -1:
+                    keep = len(self._FENCE_CLOSE) - 1
+                    if len(self._buffer) > keep:
+                        self._json_parts.append(self._buffer[:-keep])
+                        self._buffer = self._buffer[-keep:]
+                    return
+                self._json_parts.append(self._buffer[:idx])
+                self._buffer = ""
+                self.complete = True
+                return
+
+    @property
+    def audit_text(self) -> str:
+        return "".join(self._audit_parts).strip()
+
+    @property
+    def policy_text(self) -> str:
+        return "".join(self._json_parts).strip()
+
+
+class SemanticCache:
+    """
+    Similarity cache of generated policies keyed by norms embeddings.
+
+    Norms text is embedded with a local Ollama embedding model and the
+    (embedding, result) pair is stored in SQLite. A lookup reuses a
+    previous generation when the cosine similarity against a cached
+    entry for the same domain exceeds the threshold, skipping the full
+    LLM call for near-duplicate norms.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        embed_model: str = "nomic-embed-text",
+        threshold: float = 0.95,
+    ):
+        self.db_path = Path(db_path) if db_path else Path.home() / ".cache" / "justitia" / "semantic_cache.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.embed_model = embed_model
+        self.threshold = threshold
+        # One pooled client for all embedding calls (keep-alive instead
+        # of a fresh connection per request)
+        self._client = ollama.Client(host=os.getenv("OLLAMA_HOST"), timeout=60)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "domain TEXT NOT NULL, "
+            "embedding TEXT NOT NULL, "
+            "result TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _embed(self, text: str) -> List[float]:
+        """Embed text via the local Ollama embedding model."""
+        response = self._client.embeddings(model=self.embed_model, prompt=text)
+        return list(response["embedding"])
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several texts, batching into one /api/embed round-trip.
+
+        Falls back to one request per text on Ollama versions that
+        predate the batch endpoint.
+        """
+        if len(texts) == 1:
+            return [self._embed(texts[0])]
+
+        host = os.getenv("OLLAMA_HOST", "http://localhost:11434").rstrip("/")
+        try:
+            import httpx
+            response = httpx.post(
+                f"{host}/api/embed",
+                json={"model": self.embed_model, "input": texts},
+                timeout=60,
+            )
+            response.raise_for_status()
+            embeddings = response.json().get("embeddings")
+            if embeddings and len(embeddings) == len(texts):
+                return [list(e) for e in embeddings]
+        except Exception:
+            pass
+
+        return [self._embed(text) for text in texts]
+
+    @staticmethod
+    def _cosine(a: List[float], b: List[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
+
+    def lookup(self, norms_text: str, domain: str) -> Optional[Dict]:
+        """Return a cached result for sufficiently similar norms, or None."""
+        try:
+            query = self._embed(norms_text)
+            rows = self._conn.execute(
+                "SELECT embedding, result FROM entries WHERE domain = ?", (domain,)
+            ).fetchall()
+        except Exception:
+            return None  # cache is best-effort
+
+        best_score, best_result = 0.0, None
+        for embedding_json, result_json in rows:
+            score = self._cosine(query, json.loads(embedding_json))
+            if score > best_score:
+                best_score, best_result = score, result_json
+
+        if best_result is not None and best_score >= self.threshold:
+            return json.loads(best_result)
+        return None
+
+    def store(self, norms_text: str, domain: str, result: Dict) -> None:
+        """Insert a generation result keyed by the norms embedding."""
+        try:
+            embedding = self._embed(norms_text)
+            self._conn.execute(
+                "INSERT INTO entries (domain, embedding, result) VALUES (?, ?, ?)",
+                (domain, json.dumps(embedding), json.dumps(result, ensure_ascii=False)),
+            )
+            self._conn.commit()
+        except Exception:
+            pass  # cache is best-effort
 
 
 class PolicyGenerator:
@@ -20,37 +323,30 @@ class PolicyGenerator:
         reasoning_effort: str = "medium",
         use_browser: bool = False,
         use_python: bool = True,
+        semantic_cache: Optional[SemanticCache] = None,
+        cache: Optional["CacheBackend"] = None,
     ):
         self.domain = domain
         self.model_name = model_name
         self.reasoning_effort = reasoning_effort
         self.use_browser = use_browser
         self.use_python = use_python
+        self.semantic_cache = semantic_cache
+        self.cache = cache
+        # Reused across calls so generations share one pooled HTTP
+        # client (keep-alive) instead of the module-level singleton's
+        # transient connections. Explicit timeout so a wedged server
+        # surfaces as an error rather than an infinite wait.
+        self._client = ollama.Client(host=os.getenv("OLLAMA_HOST"), timeout=600)
+        self._async_client = ollama.AsyncClient(host=os.getenv("OLLAMA_HOST"), timeout=600)
 
-    def generate_policy(
-        self,
-        norms_text: str,
-        developer_message: str = "",
-        max_tokens: int = 2048,
-    ) -> Dict[str, any]:
-        """
-        Generate policy rules JSON and chain-of-thought reasoning text.
-
-        Args:
-            norms_text: Free text norms or policy descriptions.
-            developer_message: Optional developer instructions.
-            max_tokens: Maximum tokens to generate.
-
-        Returns:
-            Dictionary with:
-              - policy_json: Parsed policy JSON object from output (dict)
-              - audit_notebook: Chain-of-thought reasoning text (str)
-              - raw_response: Full raw model output (str)
-        """
+        # Prompt fragments are fixed for the lifetime of the generator;
+        # only norms_text and the optional developer message vary per
+        # call, so the domain/effort substitution happens once here.
         # Enhanced developer message for better JSON output
-        enhanced_dev_message = f"""
+        self._system_prompt_base = f"""
         You are a policy compiler. Generate a JSON policy specification from the given norms.
-        
+
         Output format:
         {{
           "domain": "{self.domain}",
@@ -66,16 +362,14 @@ class PolicyGenerator:
           ],
           "metadata": {{}}
         }}
-        
+
         Reasoning effort: {self.reasoning_effort}
-        {developer_message}
         """
-        
-        # Create user prompt
-        user_prompt = f"""
+        self._user_prompt_prefix = """
         Transform the following organizational norms into a structured JSON policy:
 
-        {norms_text}
+        """
+        self._user_prompt_suffix = f"""
 
         Requirements:
         - Generate regex patterns that can detect violations
@@ -105,78 +399,292 @@ class PolicyGenerator:
         ```
         """
 
+    def _build_messages(self, norms_text: str, developer_message: str = "") -> list:
+        """
+        Build the system/user message pair sent to the model.
+
+        Args:
+            norms_text: Free text norms or policy descriptions.
+            developer_message: Optional developer instructions.
+
+        Returns:
+            List of message dicts for ollama chat calls.
+        """
+        enhanced_dev_message = "".join(
+            (self._system_prompt_base, developer_message, "\n        ")
+        )
+        user_prompt = "".join(
+            (self._user_prompt_prefix, norms_text, self._user_prompt_suffix)
+        )
+
+        return [
+            {
+                "role": "system",
+                "content": enhanced_dev_message
+            },
+            {
+                "role": "user",
+                "content": user_prompt
+            }
+        ]
+
+    def _build_options(self, max_tokens: int) -> Dict[str, any]:
+        """Build the ollama sampling options dict."""
+        return {
+            "temperature": 0.7,
+            "top_p": 0.9,
+            "num_predict": max_tokens,
+        }
+
+    def _package_response(self, full_output: str) -> Dict[str, any]:
+        """Extract policy JSON and reasoning from raw output into a result dict."""
+        policy_json, audit_notebook = self._extract_policy_and_cot(full_output)
+
+        return {
+            "policy_json": policy_json,
+            "audit_notebook": audit_notebook,
+            "raw_response": full_output,
+        }
+
+    def generate_policy(
+        self,
+        norms_text: str,
+        developer_message: str = "",
+        max_tokens: int = 2048,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        on_rule: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict[str, any]:
+        """
+        Generate policy rules JSON and chain-of-thought reasoning text.
+
+        The request is streamed so long generations don't sit behind a
+        silent non-streaming call (which some Ollama versions stall on);
+        chunks are accumulated into the full response.
+
+        Args:
+            norms_text: Free text norms or policy descriptions.
+            developer_message: Optional developer instructions.
+            max_tokens: Maximum tokens to generate.
+            on_chunk: Optional callback invoked with each streamed text chunk
+                (for progress display).
+            on_rule: Optional callback invoked with each rule dict as soon as
+                it closes in the streamed JSON (needs ijson; otherwise rules
+                are delivered once the full response has been parsed).
+
+        Returns:
+            Dictionary with:
+              - policy_json: Parsed policy JSON object from output (dict)
+              - audit_notebook: Chain-of-thought reasoning text (str)
+              - raw_response: Full raw model output (str)
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                self.model_name, self.domain, self.reasoning_effort,
+                norms_text, developer_message,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.lookup(norms_text, self.domain)
+            if cached is not None:
+                return cached
+
         try:
-            # Send request to Ollama
-            response = ollama.chat(
+            # Send request to Ollama and accumulate the streamed chunks
+            stream = self._client.chat(
                 model=self.model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": enhanced_dev_message
-                    },
-                    {
-                        "role": "user", 
-                        "content": user_prompt
+                messages=self._build_messages(norms_text, developer_message),
+                options=self._build_options(max_tokens),
+                stream=True,
+            )
+
+            rule_parser = None
+            if on_rule is not None and ijson is not None:
+                rule_parser = _RuleStreamParser(on_rule)
+
+            section_parser = _SectionStreamParser()
+            pieces = []
+            for chunk in stream:
+                piece = chunk.get("message", {}).get("content", "")
+                if piece:
+                    pieces.append(piece)
+                    if on_chunk is not None:
+                        on_chunk(piece)
+                    if rule_parser is not None:
+                        rule_parser.feed(piece)
+                    section_parser.feed(piece)
+            full_output = "".join(pieces)
+
+            # A response that followed the prompted layout has already
+            # been sectioned during streaming; only malformed output
+            # pays for the regex sweep over the full text.
+            result = None
+            if section_parser.complete:
+                try:
+                    policy_data = _loads(section_parser.policy_text)
+                except (json.JSONDecodeError, ValueError):
+                    policy_data = None
+                # A fenced payload that isn't a JSON object (e.g. a bare
+                # rules array) goes through the fallback extraction,
+                # which copes with such shapes
+                if isinstance(policy_data, dict):
+                    result = {
+                        "policy_json": _validate_rule_patterns(policy_data),
+                        "audit_notebook": section_parser.audit_text,
+                        "raw_response": full_output,
                     }
-                ],
-                options={
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "num_predict": max_tokens,
-                }
+            if result is None:
+                result = self._package_response(full_output)
+
+            # Fallback delivery when incremental parsing wasn't available
+            if on_rule is not None and rule_parser is None:
+                for rule in result["policy_json"].get("rules", []):
+                    on_rule(rule)
+
+            if self.cache is not None:
+                self.cache.set(cache_key, result)
+            if self.semantic_cache is not None:
+                self.semantic_cache.store(norms_text, self.domain, result)
+
+            return result
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to query Ollama model '{self.model_name}': {e}")
+
+    async def generate_policy_async(
+        self,
+        norms_text: str,
+        developer_message: str = "",
+        max_tokens: int = 2048,
+    ) -> Dict[str, any]:
+        """
+        Async variant of generate_policy using ollama.AsyncClient.
+
+        Multiple concurrent calls overlap network I/O and server-side
+        compute (bounded by OLLAMA_NUM_PARALLEL on the Ollama side),
+        which is what the `generate-batch` CLI command relies on.
+
+        Args:
+            norms_text: Free text norms or policy descriptions.
+            developer_message: Optional developer instructions.
+            max_tokens: Maximum tokens to generate.
+
+        Returns:
+            Same result dictionary as generate_policy.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                self.model_name, self.domain, self.reasoning_effort,
+                norms_text, developer_message,
             )
-            
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self._async_client.chat(
+                model=self.model_name,
+                messages=self._build_messages(norms_text, developer_message),
+                options=self._build_options(max_tokens),
+            )
+
             full_output = response.get("message", {}).get("content", "")
-            
-            # Extract JSON policy and chain-of-thought
-            policy_json, audit_notebook = self._extract_policy_and_cot(full_output)
-
-            return {
-                "policy_json": policy_json,
-                "audit_notebook": audit_notebook,
-                "raw_response": full_output,
-            }
-            
+
+            result = self._package_response(full_output)
+
+            if self.cache is not None:
+                self.cache.set(cache_key, result)
+
+            return result
+
         except Exception as e:
             raise RuntimeError(f"Failed to query Ollama model '{self.model_name}': {e}")
 
+    async def generate_many(self, norms_list: List[str]) -> List[Dict[str, any]]:
+        """
+        Generate policies for several norms texts concurrently.
+
+        Args:
+            norms_list: Norms texts to generate policies for.
+
+        Returns:
+            List of generate_policy result dicts, in input order.
+        """
+        return await asyncio.gather(
+            *[self.generate_policy_async(norms_text) for norms_text in norms_list]
+        )
+
+    def generate_policy_batch(self, norms_list: List[str]) -> List[Dict[str, any]]:
+        """
+        Synchronous batch generation for several norms texts.
+
+        Ollama exposes no true multi-prompt batch endpoint yet, so the
+        prompts are fanned out as concurrent requests via generate_many;
+        the server stacks them into one decode batch up to
+        OLLAMA_NUM_PARALLEL. Swap this for the native batch API when it
+        lands to amortize prompt processing in a single request.
+
+        Args:
+            norms_list: Norms texts to generate policies for.
+
+        Returns:
+            List of generate_policy result dicts, in input order.
+        """
+        return asyncio.run(self.generate_many(norms_list))
+
     def _extract_policy_and_cot(self, output_text: str) -> Tuple[Dict, str]:
         """
         Parses model output into structured JSON policy and chain-of-thought reasoning.
 
+        Extraction is pure in the output text, so results are memoized;
+        re-parsing the same raw response (common in notebook loops) is a
+        cache hit instead of a fresh regex-and-JSON pass. The policy
+        dict is deep-copied on the way out so callers that mutate it
+        can't corrupt the cached entry for later parses.
+
         Args:
             output_text: Full model response text
 
         Returns:
             (policy_dict, audit_text)
         """
-        try:
-            # Extract thinking/reasoning section
-            thinking_match = re.search(r"\*\*THINKING:\*\*(.*?)\*\*POLICY:\*\*", output_text, re.DOTALL | re.IGNORECASE)
-            audit_text = thinking_match.group(1).strip() if thinking_match else ""
-            
-            # Extract JSON block from text
-            json_match = re.search(r"```json\s*(\{.*?\})\s*```", output_text, re.DOTALL)
+        policy_data, audit_text = _extract_policy_and_cot_cached(output_text)
+        return copy.deepcopy(policy_data), audit_text
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_policy_and_cot_cached(output_text: str) -> Tuple[Dict, str]:
+    try:
+        # Extract thinking/reasoning section
+        thinking_match = _THINK_RE.search(output_text)
+        audit_text = thinking_match.group(1).strip() if thinking_match else ""
+
+        # Extract JSON block from text
+        json_match = _JSON_FENCE_RE.search(output_text)
+        if json_match:
+            json_text = json_match.group(1)
+            policy_data = _validate_rule_patterns(_loads(json_text))
+            return policy_data, audit_text
+        else:
+            # Try to find any JSON-like structure
+            json_match = _JSON_FALLBACK_RE.search(output_text)
             if json_match:
                 json_text = json_match.group(1)
-                policy_data = json.loads(json_text)
-                return policy_data, audit_text
+                policy_data = _validate_rule_patterns(_loads(json_text))
+                return policy_data, audit_text if audit_text else output_text
             else:
-                # Try to find any JSON-like structure
-                json_match = re.search(r"(\{.*\})", output_text, re.DOTALL)
-                if json_match:
-                    json_text = json_match.group(1)
-                    policy_data = json.loads(json_text)
-                    return policy_data, audit_text if audit_text else output_text
-                else:
-                    # If no JSON found, return empty policy with full text as audit
-                    return {}, output_text
-                    
-        except json.JSONDecodeError as e:
-            # If JSON parsing fails, return empty policy with full text as audit
-            return {}, f"JSON parsing failed: {e}\n\nFull response:\n{output_text}"
-        except Exception as e:
-            return {}, f"Error extracting policy: {e}\n\nFull response:\n{output_text}"
+                # If no JSON found, return empty policy with full text as audit
+                return {}, output_text
+
+    except json.JSONDecodeError as e:
+        # If JSON parsing fails, return empty policy with full text as audit
+        return {}, f"JSON parsing failed: {e}\n\nFull response:\n{output_text}"
+    except Exception as e:
+        return {}, f"Error extracting policy: {e}\n\nFull response:\n{output_text}"
 
 
 def save_policy_pack(policy: Dict, audit_text: str, output_dir: Path):
@@ -189,19 +697,25 @@ def save_policy_pack(policy: Dict, audit_text: str, output_dir: Path):
         output_dir: Directory to save files in
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save policy JSON
+
+    # Save policy JSON; orjson's indented dump avoids stdlib json's
+    # pure-Python encoder path and writes in a single call
     policy_path = output_dir / "policy.json"
-    with policy_path.open("w", encoding="utf-8") as f:
-        json.dump(policy, f, indent=2, ensure_ascii=False)
-    
-    # Save audit notebook
+    if orjson is not None:
+        policy_path.write_bytes(orjson.dumps(policy, option=orjson.OPT_INDENT_2))
+    else:
+        policy_path.write_text(
+            json.dumps(policy, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+    # Assemble the audit notebook once and write it in one call
     audit_path = output_dir / "audit_notebook.md"
-    with audit_path.open("w", encoding="utf-8") as f:
-        f.write("# JUSTITIA Policy Generation Audit Notebook\n\n")
-        f.write(f"**Domain:** {policy.get('domain', 'Unknown')}\n\n")
-        f.write(f"**Generated:** {policy.get('version', 'Unknown')}\n\n")
-        f.write("## Chain-of-Thought Reasoning\n\n")
-        f.write(audit_text if audit_text else "No reasoning captured.")
-        f.write("\n\n---\n\n")
-        f.write("*Generated by JUSTITIA AI Policy Compiler*\n")
\ No newline at end of file
+    audit_path.write_text("".join([
+        "# JUSTITIA Policy Generation Audit Notebook\n\n",
+        f"**Domain:** {policy.get('domain', 'Unknown')}\n\n",
+        f"**Generated:** {policy.get('version', 'Unknown')}\n\n",
+        "## Chain-of-Thought Reasoning\n\n",
+        audit_text if audit_text else "No reasoning captured.",
+        "\n\n---\n\n",
+        "*Generated by JUSTITIA AI Policy Compiler*\n",
+    ]), encoding="utf-8")
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+JUSTITIA Policy Response Cache
+
+Exact-match cache for PolicyGenerator results, keyed by a deterministic
+SHA-256 hash of the full request. A hit returns the stored result dict
+directly and skips the model call and output parsing entirely. The
+embedding-similarity tier for near-duplicate norms lives in
+justitia.policy.SemanticCache.
+"""
+
+import copy
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional, Protocol
+
+
+def make_cache_key(
+    model_name: str,
+    domain: str,
+    reasoning_effort: str,
+    norms_text: str,
+    developer_message: str = "",
+) -> str:
+    """Build the deterministic cache key for one generation request."""
+    payload = json.dumps(
+        {
+            "model": model_name,
+            "domain": domain,
+            "effort": reasoning_effort,
+            "norms": norms_text,
+            "dev": developer_message,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Interface a PolicyGenerator cache backend must provide."""
+
+    def get(self, key: str) -> Optional[Dict]:
+        ...
+
+    def set(self, key: str, value: Dict) -> None:
+        ...
+
+
+class MemoryCache:
+    """
+    In-process dict backend, useful for notebooks and tests.
+
+    Entries are deep-copied on both set and get so callers mutating a
+    stored or returned result can't corrupt the cached copy — the same
+    isolation FileCache gets for free from serializing through JSON.
+    """
+
+    def __init__(self):
+        self._store: Dict[str, Dict] = {}
+
+    def get(self, key: str) -> Optional[Dict]:
+        value = self._store.get(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    def set(self, key: str, value: Dict) -> None:
+        self._store[key] = copy.deepcopy(value)
+
+
+class FileCache:
+    """
+    One JSON file per entry under a cache directory.
+
+    All I/O is best-effort: a corrupt or unwritable entry degrades to a
+    cache miss rather than failing the generation.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "justitia" / "responses"
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            path = self.cache_dir / f"{key}.json"
+            if path.exists():
+                return json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            pass
+        return None
+
+    def set(self, key: str, value: Dict) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            path.write_text(json.dumps(value, ensure_ascii=False), encoding="utf-8")
+        except OSError:
+            pass
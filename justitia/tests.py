@@ -5,19 +5,82 @@ Validates generated policies against test cases with transparent results.
 """
 
 import json
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+try:
+    import re2 as _re2  # optional linear-time engine (pip install google-re2)
+    _RE2_OPTIONS = _re2.Options()
+    _RE2_OPTIONS.log_errors = False  # fallback handles parse errors; keep stderr clean
+except ImportError:
+    _re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
 
+def _compile_pattern(pattern_text: str, flags=re.IGNORECASE | re.MULTILINE):
+    """
+    Compile a rule pattern, preferring re2 when installed.
+
+    re2 runs in linear time, so adversarial or pathological patterns in
+    LLM-generated policies can't blow up scan time (ReDoS). Patterns it
+    can't express (backreferences, lookarounds) fall back to stdlib re.
+    """
+    if _re2 is not None:
+        # re2.compile does not accept stdlib flag ints; express the
+        # flags as an inline (?ims) prefix, which both engines honor
+        inline = ""
+        if flags & re.IGNORECASE:
+            inline += "i"
+        if flags & re.MULTILINE:
+            inline += "m"
+        if flags & re.DOTALL:
+            inline += "s"
+        try:
+            return _re2.compile(
+                f"(?{inline}){pattern_text}" if inline else pattern_text,
+                options=_RE2_OPTIONS,
+            )
+        except _re2.error:
+            pass  # unsupported syntax; stdlib re below handles it
+    return re.compile(pattern_text, flags)
+
+
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+
+def _literal_of(pattern_text: str) -> Optional[str]:
+    """
+    Return the lowercased literal for a metacharacter-free pattern.
+
+    Such a pattern can only match where its text appears verbatim
+    (case-insensitively, matching the scan flags), so a plain substring
+    check can rule it out without running the regex engine. Patterns
+    containing any metacharacter return None and always get a full scan.
+    """
+    if any(ch in _REGEX_META for ch in pattern_text):
+        return None
+    return pattern_text.lower()
+
+
 class Rule(BaseModel):
     """Individual policy rule with pattern matching"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str = Field(..., description="Unique rule identifier")
     description: str = Field(..., description="Human-readable rule description")
     pattern: str = Field(..., description="Regex pattern for matching violations")
@@ -28,6 +91,8 @@ class Rule(BaseModel):
 
 class Policy(BaseModel):
     """Complete policy specification"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     domain: str = Field(..., description="Policy domain (e.g., content-moderation)")
     version: str = Field(default="1.0", description="Policy version")
     rules: List[Rule] = Field(..., description="List of policy rules")
@@ -36,6 +101,8 @@ class Policy(BaseModel):
 
 class TestCase(BaseModel):
     """Individual test case for policy validation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str = Field(..., description="Test case identifier")
     text: str = Field(..., description="Text content to test")
     expected_violations: List[str] = Field(..., description="Rule IDs expected to be triggered")
@@ -43,14 +110,20 @@ class TestCase(BaseModel):
     category: str = Field(default="general", description="Test category")
 
 
-class TestResult(BaseModel):
-    """Result of running a single test case"""
+@dataclass
+class TestResult:
+    """Result of running a single test case.
+
+    A plain dataclass rather than a model: results are created once per
+    test on the hot path and only read afterwards, so there is nothing
+    to validate.
+    """
     test_id: str
     violations_found: List[str]
     passed: bool
     false_positives: List[str]  # Rules triggered but not expected
     false_negatives: List[str]  # Rules expected but not triggered
-    score: float = Field(default=0.0, description="Test score (0.0-1.0)")
+    score: float = 0.0  # Test score (0.0-1.0)
 
 
 class PolicyTestSuite:
@@ -74,7 +147,50 @@ class PolicyTestSuite:
             self.test_cases = self._load_test_cases()
         else:
             raise ValueError("Either provide file paths (policy_path, cases_path) or data (policy_data, test_cases_data)")
-    
+
+        self._compile_rules()
+
+    def _compile_rules(self) -> None:
+        """
+        Compile each rule's pattern once at policy-load time.
+
+        Invalid patterns are reported here, a single time, and excluded
+        from the scan path so run_single_test never has to handle
+        re.error. The per-pattern cache is keyed by pattern text, so it
+        survives policy swaps in run_tests.
+        """
+        cache: Dict[str, Optional["re.Pattern"]] = getattr(self, "_pattern_cache", {})
+        self._pattern_cache = cache
+
+        compiled = []
+        for rule in self.policy.rules:
+            if rule.pattern in cache:
+                pattern = cache[rule.pattern]
+            else:
+                try:
+                    pattern = _compile_pattern(rule.pattern)
+                except re.error as e:
+                    console.print(f"⚠️ Invalid regex in rule {rule.id}: {e}", style="yellow")
+                    pattern = None
+                cache[rule.pattern] = pattern
+            if pattern is not None:
+                compiled.append((rule, pattern, _literal_of(rule.pattern)))
+        self._compiled = compiled
+
+        # Fuse all patterns into one named-group alternation so a single
+        # C-level pass over the text can decide the common "clean" case
+        # instead of R independent scans. Falls back to per-rule scans if
+        # the union doesn't compile (e.g. clashing group names).
+        self._group_to_rule = {f"r{i}": rule.id for i, (rule, _, _) in enumerate(compiled)}
+        self._fused = None
+        if compiled:
+            try:
+                self._fused = _compile_pattern(
+                    "|".join(f"(?P<r{i}>{rule.pattern})" for i, (rule, _, _) in enumerate(compiled))
+                )
+            except re.error:
+                self._fused = None
+
     def _load_policy(self) -> Policy:
         """Load and validate policy JSON"""
         if not hasattr(self, 'policy_path') or self.policy_path is None:
@@ -113,6 +229,7 @@ class PolicyTestSuite:
             # Update policy and test cases with provided data
             if policy_data is not None:
                 self.policy = Policy(**policy_data)
+                self._compile_rules()
             if test_cases_data is not None:
                 # Handle both single dict and list formats
                 if isinstance(test_cases_data, dict):
@@ -137,36 +254,67 @@ class PolicyTestSuite:
         
         return TestResults(results, report['summary'])
     
-    def run_single_test(self, test_case: TestCase) -> TestResult:
-        """Run a single test case against the policy"""
+    def _scan_text(self, text: str) -> List[str]:
+        """Return the rule IDs whose patterns match the given text."""
         violations_found = []
-        
-        # Check each rule pattern against the test text
-        for rule in self.policy.rules:
-            try:
-                if re.search(rule.pattern, test_case.text, flags=re.IGNORECASE | re.MULTILINE):
+        lowered = text.lower()
+
+        # One fused pass finds the matching rules; an empty result proves
+        # no rule matches at all. When the fused scan did hit, rules it
+        # didn't report are re-checked individually, since non-overlapping
+        # finditer matches can shadow a rule that overlaps another's match.
+        # Metacharacter-free patterns are ruled out with a substring check
+        # before paying for a regex scan.
+        if self._fused is not None:
+            fused_hits = {
+                self._group_to_rule[m.lastgroup]
+                for m in self._fused.finditer(text)
+                if m.lastgroup in self._group_to_rule
+            }
+            if fused_hits:
+                for rule, pattern, literal in self._compiled:
+                    if rule.id in fused_hits:
+                        violations_found.append(rule.id)
+                    elif literal is not None and literal not in lowered:
+                        continue
+                    elif pattern.search(text):
+                        violations_found.append(rule.id)
+        else:
+            for rule, pattern, literal in self._compiled:
+                if literal is not None and literal not in lowered:
+                    continue
+                if pattern.search(text):
                     violations_found.append(rule.id)
-            except re.error as e:
-                console.print(f"⚠️ Invalid regex in rule {rule.id}: {e}", style="yellow")
-                continue
-        
-        # Calculate test results
-        expected = set(test_case.expected_violations)
-        found = set(violations_found)
-        
-        passed = expected == found
+
+        return violations_found
+
+    def run_single_test(self, test_case: TestCase) -> TestResult:
+        """Run a single test case against the policy"""
+        return self._score_result(test_case, self._scan_text(test_case.text))
+
+    def _score_result(self, test_case: TestCase, violations_found: List[str]) -> TestResult:
+        """Score a test case given the violations its text triggered."""
+        # Intersect once and derive everything else from the counts, so
+        # each set is hashed and walked a single time.
+        expected = frozenset(test_case.expected_violations)
+        found = frozenset(violations_found)
+        intersection = expected & found
+        n_expected = len(expected)
+        n_found = len(found)
+        n_correct = len(intersection)
+
+        passed = n_expected == n_correct == n_found
         false_positives = list(found - expected)
         false_negatives = list(expected - found)
-        
+
         # Calculate score (1.0 = perfect, 0.0 = completely wrong)
-        if len(expected) == 0 and len(found) == 0:
+        if n_expected == 0 and n_found == 0:
             score = 1.0
-        elif len(expected) == 0:
+        elif n_expected == 0:
             score = 0.0  # Found violations when none expected
         else:
-            correct = len(expected & found)
-            total_errors = len(false_positives) + len(false_negatives)
-            score = max(0.0, (correct - total_errors) / len(expected))
+            total_errors = (n_found - n_correct) + (n_expected - n_correct)
+            score = max(0.0, (n_correct - total_errors) / n_expected)
         
         return TestResult(
             test_id=test_case.id,
@@ -177,9 +325,78 @@ class PolicyTestSuite:
             score=score
         )
     
-    def run_all_tests(self) -> List[TestResult]:
-        """Run all test cases and return results"""
-        return [self.run_single_test(case) for case in self.test_cases]
+    # Separator between test texts in the prefilter blob; the newlines
+    # keep ^/$ anchors behaving as they would on the individual texts.
+    _SENTINEL = "\n\x1e\x1e\n"
+
+    def _prefilter_dirty_cases(self) -> Optional[set]:
+        """
+        Find which test cases can possibly trigger any rule in one pass.
+
+        Concatenates all test texts (sentinel-separated) and runs the
+        fused alternation once, attributing each match back to its test
+        case by offset. Every segment between a match's start and end
+        offsets is attributed, so a match spanning one or more
+        boundaries (e.g. a [\\s\\S]* pattern crossing the sentinel, or
+        one shadowing an overlapping match) marks each affected case
+        for a full scan. Returns None when the prefilter can't be used
+        — no fused pattern, or \\A/\\Z-anchored patterns whose meaning
+        changes inside the blob.
+        """
+        if self._fused is None or len(self.test_cases) <= 1:
+            return None
+        if any("\\A" in rule.pattern or "\\Z" in rule.pattern for rule, _, _ in self._compiled):
+            return None
+
+        segment_starts = []
+        parts = []
+        pos = 0
+        for case in self.test_cases:
+            segment_starts.append(pos)
+            part = self._SENTINEL + case.text
+            parts.append(part)
+            pos += len(part)
+        blob = "".join(parts)
+
+        dirty = set()
+        for m in self._fused.finditer(blob):
+            start_seg = bisect_right(segment_starts, m.start()) - 1
+            end_seg = bisect_right(segment_starts, max(m.end() - 1, m.start())) - 1
+            dirty.update(range(start_seg, end_seg + 1))
+        return dirty
+
+    def run_all_tests(self, max_workers: Optional[int] = None) -> List[TestResult]:
+        """
+        Run all test cases and return results.
+
+        A single fused scan over all test texts first rules out the
+        cases that can't match anything; only the remainder get a full
+        per-case scan, on a thread pool (the C-level scan releases the
+        GIL). Pass max_workers=1 to force serial execution.
+        """
+        dirty = self._prefilter_dirty_cases()
+        if dirty is not None:
+            results: List[Optional[TestResult]] = [None] * len(self.test_cases)
+            to_scan = []
+            for i, case in enumerate(self.test_cases):
+                if i in dirty:
+                    to_scan.append((i, case))
+                else:
+                    results[i] = self._score_result(case, [])
+            if to_scan:
+                if max_workers == 1 or len(to_scan) == 1:
+                    scanned = [self.run_single_test(case) for _, case in to_scan]
+                else:
+                    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                        scanned = list(executor.map(self.run_single_test, [case for _, case in to_scan]))
+                for (i, _), result in zip(to_scan, scanned):
+                    results[i] = result
+            return results
+
+        if max_workers == 1 or len(self.test_cases) <= 1:
+            return [self.run_single_test(case) for case in self.test_cases]
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(self.run_single_test, self.test_cases))
     
     def generate_report(self, results: List[TestResult]) -> Dict[str, Any]:
         """Generate summary report from test results"""
@@ -195,7 +412,7 @@ class PolicyTestSuite:
                 "pass_rate": passed_tests / total_tests if total_tests > 0 else 0.0,
                 "average_score": average_score
             },
-            "results": [r.dict() for r in results]
+            "results": [asdict(r) for r in results]
         }
     
     def display_results(self, results: List[TestResult]):
@@ -237,66 +454,78 @@ Average Score: {summary['average_score']:.3f}
         console.print(Panel(summary_text.strip(), title="📊 Test Summary", style="green" if summary['pass_rate'] > 0.8 else "yellow"))
 
 
+# Sample test cases per domain, built once at import time rather than on
+# every create_sample_test_cases call.
+_SAMPLE_CASES = {
+    "content-moderation": {
+        "test_cases": [
+            {
+                "id": "hate_speech_1",
+                "text": "I hate those people, they should all die",
+                "expected_violations": ["hate_speech", "threats"],
+                "description": "Clear hate speech with death threat",
+                "category": "hate_speech"
+            },
+            {
+                "id": "clean_content_1",
+                "text": "I love this new feature, great job team!",
+                "expected_violations": [],
+                "description": "Positive, clean content",
+                "category": "clean"
+            },
+            {
+                "id": "harassment_1",
+                "text": "You're stupid @user stop posting here nobody likes you",
+                "expected_violations": ["harassment", "personal_attacks"],
+                "description": "Personal attack and harassment",
+                "category": "harassment"
+            }
+        ]
+    },
+    "code-review": {
+        "test_cases": [
+            {
+                "id": "hardcoded_secret_1",
+                "text": "API_KEY = 'sk-1234567890abcdef'",
+                "expected_violations": ["hardcoded_secrets"],
+                "description": "Hardcoded API key",
+                "category": "security"
+            },
+            {
+                "id": "clean_code_1",
+                "text": "def calculate_sum(a, b):\n    return a + b",
+                "expected_violations": [],
+                "description": "Clean, simple function",
+                "category": "clean"
+            }
+        ]
+    }
+}
+
+_GENERIC_SAMPLE_CASES = {
+    "test_cases": [
+        {
+            "id": "sample_1",
+            "text": "Sample text for testing",
+            "expected_violations": [],
+            "description": "Generic sample case",
+            "category": "general"
+        }
+    ]
+}
+
+
 def create_sample_test_cases(domain: str, output_path: Path):
     """Generate sample test cases for a given domain"""
-    
-    if domain == "content-moderation":
-        sample_cases = {
-            "test_cases": [
-                {
-                    "id": "hate_speech_1",
-                    "text": "I hate those people, they should all die",
-                    "expected_violations": ["hate_speech", "threats"],
-                    "description": "Clear hate speech with death threat",
-                    "category": "hate_speech"
-                },
-                {
-                    "id": "clean_content_1", 
-                    "text": "I love this new feature, great job team!",
-                    "expected_violations": [],
-                    "description": "Positive, clean content",
-                    "category": "clean"
-                },
-                {
-                    "id": "harassment_1",
-                    "text": "You're stupid @user stop posting here nobody likes you",
-                    "expected_violations": ["harassment", "personal_attacks"],
-                    "description": "Personal attack and harassment",
-                    "category": "harassment"
-                }
-            ]
-        }
-    elif domain == "code-review":
-        sample_cases = {
-            "test_cases": [
-                {
-                    "id": "hardcoded_secret_1",
-                    "text": "API_KEY = 'sk-1234567890abcdef'",
-                    "expected_violations": ["hardcoded_secrets"],
-                    "description": "Hardcoded API key",
-                    "category": "security"
-                },
-                {
-                    "id": "clean_code_1",
-                    "text": "def calculate_sum(a, b):\n    return a + b",
-                    "expected_violations": [],
-                    "description": "Clean, simple function",
-                    "category": "clean"
-                }
-            ]
-        }
+    sample_cases = _SAMPLE_CASES.get(domain, _GENERIC_SAMPLE_CASES)
+
+    if orjson is not None:
+        payload = orjson.dumps(sample_cases, option=orjson.OPT_INDENT_2)
     else:
-        sample_cases = {
-            "test_cases": [
-                {
-                    "id": "sample_1",
-                    "text": "Sample text for testing",
-                    "expected_violations": [],
-                    "description": "Generic sample case",
-                    "category": "general"
-                }
-            ]
-        }
-    
-    with output_path.open('w', encoding='utf-8') as f:
-        json.dump(sample_cases, f, indent=2)
\ No newline at end of file
+        payload = json.dumps(sample_cases, indent=2).encode("utf-8")
+
+    # Samples are fixed per domain, so a warm run is just a read+compare
+    # instead of a rewrite.
+    if output_path.exists() and output_path.read_bytes() == payload:
+        return
+    output_path.write_bytes(payload)
\ No newline at end of file
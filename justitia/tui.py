@@ -19,46 +19,72 @@ from rich.text import Text
 from justitia.policy import PolicyGenerator, save_policy_pack
 from justitia.tests import PolicyTestSuite, create_sample_test_cases
 
+try:
+    import uvloop  # optional: faster libuv-backed event loop (not on Windows)
+except ImportError:
+    uvloop = None
+
+# Rich color per severity, looked up once per rule when rendering results
+_SEVERITY_COLOR = {"high": "red", "medium": "yellow", "low": "green"}
+
+# Fixed status strings, built once instead of per write
+_MSG_EMPTY_INPUT = "[red]❌ Please enter policy norms before generating.[/red]"
+_MSG_GENERATING = "[green]🧠 Generating policy with gpt-oss...[/green]"
+_MSG_CONTACTING = "[yellow]⏳ Contacting Ollama server...[/yellow]"
+_MSG_SUCCESS = "[green]✅ Policy generated successfully![/green]"
+_MSG_RULES_STREAMING = "[bold cyan]📋 Policy rules (streaming):[/bold cyan]"
+_MSG_REASONING_HEADER = "[bold magenta]🔍 Reasoning Process (Preview):[/bold magenta]"
+_MSG_OLLAMA_HINT = "[yellow]💡 Make sure Ollama is running: ollama serve[/yellow]"
+_MSG_CLEARED = "🏛️ Interface cleared. Ready for new policy generation!"
+
+_WELCOME_LINES = (
+    "🏛️ Welcome to JUSTITIA Policy Compiler!",
+    "📝 Enter your policy norms above and click 'Generate Policy'",
+    "🎯 Built for OpenAI Open Model Hackathon 2025",
+    "",
+)
+
+# Sample norms per domain for the "Load Sample" button
+_SAMPLE_NORMS = {
+    "content-moderation": """Content Moderation Policy
+
+Our platform prohibits:
+1. Hate speech targeting individuals or groups based on protected characteristics
+2. Harassment including personal attacks, threats, and bullying behavior
+3. Explicit content including graphic violence and adult material
+4. Spam and misleading information
+
+Generate JSON rules with regex patterns to detect these violations.
+Include rationale for each rule and appropriate severity levels.""",
+
+    "code-review": """Code Review Security Policy
+
+Security requirements:
+1. No hardcoded secrets, API keys, or passwords in source code
+2. Proper input validation and sanitization required
+3. No use of deprecated or vulnerable functions
+4. All database queries must use parameterized statements
+
+Generate JSON rules to automatically detect these security issues.""",
+
+    "general": """General Policy Framework
+
+Define clear rules for:
+1. Acceptable behavior and conduct
+2. Prohibited actions and content
+3. Enforcement mechanisms and consequences
+4. Exception handling procedures
+
+Create structured, testable policy rules with clear rationale."""
+}
+
 
 class JustitiaTUI(App):
     """JUSTITIA Terminal User Interface"""
     
-    CSS = """
-    TabPane {
-        padding: 1;
-    }
-    
-    .controls {
-        height: 3;
-        margin-bottom: 1;
-    }
-    
-    #norms_input {
-        height: 10;
-        border: round $primary;
-        margin-bottom: 1;
-    }
-    
-    .button-row {
-        height: 3;
-        margin-bottom: 1;
-    }
-    
-    #output_log {
-        height: 15;
-        border: round $accent;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    
-    Select {
-        width: 1fr;
-        margin: 0 1;
-    }
-    """
-    
+    CSS_PATH = "tui.tcss"
+
+
     TITLE = "🏛️ JUSTITIA - Policy Compiler"
     SUB_TITLE = "Transparent AI Policy Generation with gpt-oss"
     
@@ -98,7 +124,9 @@ class JustitiaTUI(App):
                     Button("Clear ✨", id="clear_btn"),
                     classes="button-row"
                 )
-                yield Log(id="output_log", highlight=True)
+                # highlight=False: rule patterns are regex text that
+                # trips the ReprHighlighter's own regexes on every line
+                yield Log(id="output_log", highlight=False)
             
             with TabPane("Test Policy", id="test"):
                 yield Static("🧪 Policy Testing Interface\n\nThis tab will contain:\n• Policy validation tools\n• Test case creation\n• Results analysis\n\nComing soon!", id="test_content")
@@ -107,22 +135,44 @@ class JustitiaTUI(App):
     
     def on_mount(self) -> None:
         """Initialize the app"""
-        log = self.query_one("#output_log", Log)
-        log.write_line("🏛️ Welcome to JUSTITIA Policy Compiler!")
-        log.write_line("📝 Enter your policy norms above and click 'Generate Policy'")
-        log.write_line("🎯 Built for OpenAI Open Model Hackathon 2025")
-        log.write_line("")
+        # Eager tasks (3.12+) let coroutines that can finish without
+        # suspending — like the empty-input early return in
+        # generate_policy — complete inline instead of paying a
+        # schedule/resume round-trip through the loop.
+        # Bind the loop once; handlers then schedule work through
+        # self._loop instead of re-resolving the running loop each call
+        self._loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory"):
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+
+        # Resolve the hot widgets once; query_one walks the DOM with
+        # selector matching on every call, which adds up in handlers
+        # that fire per keystroke or click.
+        self._norms_input = self.query_one("#norms_input", TextArea)
+        self._output_log = self.query_one("#output_log", Log)
+
+        # Absolute output directory per domain, resolved lazily on first
+        # use so repeat generations skip the cwd stat in .resolve()
+        self._output_dirs: dict = {}
+
+        self._output_log.write_lines(_WELCOME_LINES)
     
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle dropdown changes"""
+        # Select also emits on programmatic updates; skip the log write
+        # and repaint when nothing actually changed
         if event.select.id == "domain_select":
-            self.current_domain = str(event.value)
-            log = self.query_one("#output_log", Log)
-            log.write_line(f"📂 Domain changed to: {event.value}")
+            value = str(event.value)
+            if value == self.current_domain:
+                return
+            self.current_domain = value
+            self._output_log.write_line(f"📂 Domain changed to: {value}")
         elif event.select.id == "effort_select":
-            self.current_effort = str(event.value)
-            log = self.query_one("#output_log", Log)
-            log.write_line(f"⚙️ Reasoning effort set to: {event.value}")
+            value = str(event.value)
+            if value == self.current_effort:
+                return
+            self.current_effort = value
+            self._output_log.write_line(f"⚙️ Reasoning effort set to: {value}")
     
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks"""
@@ -137,119 +187,142 @@ class JustitiaTUI(App):
     
     async def generate_policy(self) -> None:
         """Generate policy from input norms"""
-        norms_input = self.query_one("#norms_input", TextArea)
-        output_log = self.query_one("#output_log", Log)
-        
+        norms_input = self._norms_input
+        output_log = self._output_log
+
         norms_text = norms_input.text.strip()
         if not norms_text:
-            output_log.write_line("[red]❌ Please enter policy norms before generating.[/red]")
+            output_log.write_line(_MSG_EMPTY_INPUT)
             return
         
-        output_log.write_line("[green]🧠 Generating policy with gpt-oss...[/green]")
-        output_log.write_line(f"📂 Domain: {self.current_domain}")
-        output_log.write_line(f"⚙️ Effort: {self.current_effort}")
-        output_log.write_line("")
-        
+        # One buffered write per phase rather than a markup parse and
+        # terminal write per line
+        output_log.write_lines([
+            _MSG_GENERATING,
+            f"📂 Domain: {self.current_domain}",
+            f"⚙️ Effort: {self.current_effort}",
+            "",
+            _MSG_CONTACTING,
+        ])
+
         try:
-            # Show loading message
-            output_log.write_line("[yellow]⏳ Contacting Ollama server...[/yellow]")
-            
             # Create policy generator
             pg = PolicyGenerator(
                 domain=self.current_domain,
                 reasoning_effort=self.current_effort
             )
             
-            # Generate policy (run in thread to avoid blocking UI)
-            result = await asyncio.to_thread(pg.generate_policy, norms_text)
-            
+            # Generate in a worker thread and stream each rule back
+            # through a queue as it closes in the model output, so the
+            # log shows progress during long generations instead of
+            # freezing until the full response lands.
+            loop = self._loop
+            queue: asyncio.Queue = asyncio.Queue()
+            done = object()
+
+            def _on_rule(rule: dict) -> None:
+                # Runs on the worker thread
+                loop.call_soon_threadsafe(queue.put_nowait, rule)
+
+            async def _generate():
+                try:
+                    return await asyncio.to_thread(
+                        pg.generate_policy, norms_text, on_rule=_on_rule
+                    )
+                finally:
+                    queue.put_nowait(done)
+
+            gen_task = loop.create_task(_generate())
+
+            rule_count = 0
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                rule_count += 1
+                if rule_count == 1:
+                    output_log.write_line(_MSG_RULES_STREAMING)
+                severity = item.get("severity", "unknown")
+                color = _SEVERITY_COLOR.get(severity, "green")
+                output_log.write_lines([
+                    f"  {rule_count}. {item.get('description', 'No description')}",
+                    f"     Pattern: [dim]{item.get('pattern', 'N/A')}[/dim]",
+                    f"     Severity: [{color}]{severity}[/]",
+                    "",
+                ])
+
+            result = await gen_task
+
             policy_json = result.get("policy_json", {})
             audit_notebook = result.get("audit_notebook", "")
-            
-            # Display results
-            output_log.write_line("[green]✅ Policy generated successfully![/green]")
-            output_log.write_line("")
-            
+
+            # Kick off the disk write now so it overlaps with rendering
+            # the results below; awaited before the "saved" line
+            output_dir = self._output_dirs.get(self.current_domain)
+            if output_dir is None:
+                output_dir = Path(f"./output/{self.current_domain}").resolve()
+                self._output_dirs[self.current_domain] = output_dir
+            save_task = loop.create_task(
+                asyncio.to_thread(save_policy_pack, policy_json, audit_notebook, output_dir)
+            )
+
+            # Display summary, buffered into one write (the rules
+            # themselves were already streamed above)
+            lines = [_MSG_SUCCESS, ""]
+
             if policy_json:
-                rules_count = len(policy_json.get("rules", []))
-                output_log.write_line(f"[bold cyan]📋 Generated {rules_count} policy rules:[/bold cyan]")
-                
-                for i, rule in enumerate(policy_json.get("rules", []), 1):
-                    output_log.write_line(f"  {i}. {rule.get('description', 'No description')}")
-                    output_log.write_line(f"     Pattern: [dim]{rule.get('pattern', 'N/A')}[/dim]")
-                    output_log.write_line(f"     Severity: [{'red' if rule.get('severity') == 'high' else 'yellow' if rule.get('severity') == 'medium' else 'green'}]{rule.get('severity', 'unknown')}[/]")
-                    output_log.write_line("")
-            
+                rules = policy_json.get("rules", [])
+                lines.append(f"[bold cyan]📋 Generated {len(rules)} policy rules[/bold cyan]")
+                lines.append("")
+
             # Show audit notebook preview
             if audit_notebook:
-                output_log.write_line("[bold magenta]🔍 Reasoning Process (Preview):[/bold magenta]")
-                preview = audit_notebook[:300] + "..." if len(audit_notebook) > 300 else audit_notebook
-                output_log.write_line(f"[dim]{preview}[/dim]")
-                output_log.write_line("")
-            
-            # Save files
-            output_dir = Path(f"./output/{self.current_domain}")
-            save_policy_pack(policy_json, audit_notebook, output_dir)
-            output_log.write_line(f"[green]💾 Files saved to: {output_dir.absolute()}[/green]")
+                lines.append(_MSG_REASONING_HEADER)
+                preview = audit_notebook if len(audit_notebook) <= 300 else f"{audit_notebook[:300]}..."
+                lines.append(f"[dim]{preview}[/dim]")
+                lines.append("")
+            # batch_update paints the whole rules dump atomically (one
+            # synchronized-output frame on terminals that support it)
+            # instead of repainting per appended line
+            with self.batch_update():
+                output_log.write_lines(lines)
+
+            await save_task
+            output_log.write_line(f"[green]💾 Files saved to: {output_dir}[/green]")
             
         except Exception as e:
-            output_log.write_line(f"[red]❌ Generation failed: {str(e)}[/red]")
-            output_log.write_line("[yellow]💡 Make sure Ollama is running: ollama serve[/yellow]")
+            output_log.write_lines([
+                f"[red]❌ Generation failed: {str(e)}[/red]",
+                _MSG_OLLAMA_HINT,
+            ])
     
     def load_sample_norms(self) -> None:
         """Load sample norms for the current domain"""
-        norms_input = self.query_one("#norms_input", TextArea)
-        output_log = self.query_one("#output_log", Log)
-        
-        samples = {
-            "content-moderation": """Content Moderation Policy
-
-Our platform prohibits:
-1. Hate speech targeting individuals or groups based on protected characteristics
-2. Harassment including personal attacks, threats, and bullying behavior  
-3. Explicit content including graphic violence and adult material
-4. Spam and misleading information
+        norms_input = self._norms_input
+        output_log = self._output_log
 
-Generate JSON rules with regex patterns to detect these violations.
-Include rationale for each rule and appropriate severity levels.""",
-            
-            "code-review": """Code Review Security Policy
-
-Security requirements:
-1. No hardcoded secrets, API keys, or passwords in source code
-2. Proper input validation and sanitization required
-3. No use of deprecated or vulnerable functions
-4. All database queries must use parameterized statements
-
-Generate JSON rules to automatically detect these security issues.""",
-            
-            "general": """General Policy Framework
-
-Define clear rules for:
-1. Acceptable behavior and conduct
-2. Prohibited actions and content
-3. Enforcement mechanisms and consequences
-4. Exception handling procedures
-
-Create structured, testable policy rules with clear rationale."""
-        }
-        
-        sample_text = samples.get(self.current_domain, samples["general"])
-        norms_input.text = sample_text
+        sample_text = _SAMPLE_NORMS.get(self.current_domain, _SAMPLE_NORMS["general"])
+        # load_text replaces the document wholesale, skipping the edit
+        # bookkeeping the .text setter performs
+        norms_input.load_text(sample_text)
         output_log.write_line(f"[green]📝 Loaded sample norms for {self.current_domain}[/green]")
     
     def clear_interface(self) -> None:
         """Clear input and output"""
-        norms_input = self.query_one("#norms_input", TextArea)
-        output_log = self.query_one("#output_log", Log)
-        
-        norms_input.text = ""
+        norms_input = self._norms_input
+        output_log = self._output_log
+
+        norms_input.load_text("")
         output_log.clear()
-        output_log.write_line("🏛️ Interface cleared. Ready for new policy generation!")
+        output_log.write_line(_MSG_CLEARED)
 
 
 def main():
     """Main entry point for TUI"""
+    if uvloop is not None:
+        # Cheaper task scheduling and callbacks for the message pump;
+        # App.run() picks up the installed policy automatically.
+        uvloop.install()
     app = JustitiaTUI()
     app.run()
 
@@ -15,6 +15,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/ayushmorbar/justitia",
     packages=find_packages(),
+    package_data={"justitia": ["*.tcss"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",